@@ -1,12 +1,29 @@
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
 from dotenv import dotenv_values
 
+_PROJECT_PATH: Path = Path(__file__).resolve().parents[1]
+_ENV_PATH: Path = _PROJECT_PATH / ".env"
 
+
+@lru_cache(maxsize=1)
+def _load_env() -> Dict[str, Optional[str]]:
+    """
+    Reads and parses the `.env` file once per process.
+
+    Returns:
+        Dict[str, Optional[str]]: Variables loaded from the `.env` file.
+    """
+    return dotenv_values(dotenv_path=_ENV_PATH)
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """
-    Loads and stores project configuration variables from a `.env` file.
+    Stores project configuration variables loaded from a `.env` file.
 
     Attributes:
         LOG_FILE (Path): Path to the log file.
@@ -16,33 +33,52 @@ class Config:
         RELATIVE_URL (str): Relative path to the specific page for scraping.
     """
 
-    def __init__(self) -> None:
+    LOG_FILE: Path
+    REPORT_DIR: Path
+    REPORT_FILENAME: str
+    BASE_URL: str
+    RELATIVE_URL: str
+
+    @classmethod
+    def load(cls) -> "Config":
         """
-        Initializes the Config object and loads variables from a .env file.
+        Builds a Config from the cached contents of the .env file.
+
+        Returns:
+            Config: Immutable project configuration.
 
         Raises:
             ValueError: If any required environment variables are missing or empty.
         """
-        self._project_path: Path = Path(__file__).parents[1]
-
-        self._env_path: Path = Path(self._project_path) / ".env"
-        self._env: Dict[str, Optional[str]] = dotenv_values(dotenv_path=self._env_path)
+        env = _load_env()
+        cls._validate(env)
 
-        self.LOG_FILE: Path = Path(self._project_path) / self._env.get("LOG_FILE")
-        self.REPORT_DIR: Path = Path(self._project_path) / self._env.get("REPORT_DIR")
-        self.REPORT_FILENAME: str = self._env.get("REPORT_FILENAME")
-        self.BASE_URL: str = self._env.get("BASE_URL")
-        self.RELATIVE_URL: str = self._env.get("RELATIVE_URL")
+        return cls(
+            LOG_FILE=_PROJECT_PATH / env["LOG_FILE"],
+            REPORT_DIR=_PROJECT_PATH / env["REPORT_DIR"],
+            REPORT_FILENAME=env["REPORT_FILENAME"],
+            BASE_URL=env["BASE_URL"],
+            RELATIVE_URL=env["RELATIVE_URL"],
+        )
 
-        self._validate()
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Drops the cached `.env` contents so the next Config.load() re-reads the file.
+        """
+        _load_env.cache_clear()
 
-    def _validate(self) -> None:
+    @staticmethod
+    def _validate(env: Dict[str, Optional[str]]) -> None:
         """
         Validates the loaded environment variables.
 
+        Args:
+            env (Dict[str, Optional[str]]): Variables loaded from the `.env` file.
+
         Raises:
             ValueError: If any environment variables are missing or empty.
         """
-        missing = [key for key, value in self._env.items() if not value]
+        missing = [field.name for field in fields(Config) if not env.get(field.name)]
         if missing:
             raise ValueError(f"Missing environment variables: {missing}")
@@ -1,68 +1,61 @@
-from typing import List
+from collections import Counter
+from typing import Iterable, List, Tuple
 
-import pandas as pd
 from loguru import logger
 
 
 class DataStructurer:
     """
-    Groups a list of animal names by their first letter using pandas.
+    Groups animal names by their first letter.
 
-    This class takes a list of "animal names" and returns a grouped DataFrame
-    showing how many unique animals start with each letter of the alphabet.
+    This class takes an iterable of unique, capitalized "animal names" (as yielded
+    by WikiAnimalsParser) and returns grouped rows showing how many animals start
+    with each letter of the alphabet.
 
     Example:
         Input:
             ["Python europaeus", "Hydrochoerinae", "Python kyaiktiyo"]
 
         Output:
-            first_letter  count
-            H             1
-            P             2
+            [("H", 1), ("P", 2)]
     """
 
-    def __init__(self, data: List[str]) -> None:
+    def __init__(self, data: Iterable[str]) -> None:
         """
-        Initializes the DataStructurer with a list of animal names.
+        Initializes the DataStructurer with animal names.
 
         Args:
-            data (List[str]): List of animal names.
+            data (Iterable[str]): Unique capitalized animal names; may be a lazy
+                generator that is consumed only when grouping starts.
         """
         self.animal_names = data
 
         logger.debug("DataStructurer initialized.")
 
-    def group_animals_by_first_letter(self) -> pd.DataFrame:
+    def group_animals_by_first_letter(self) -> List[Tuple[str, int]]:
         """
-        Groups animal names by their capitalized first letter and counts unique entries.
+        Groups animal names by their first letter and counts entries.
 
-        Steps:
-            - Capitalizes names for consistency.
-            - Removes duplicates.
-            - Extracts the first character.
-            - Counts how many names start with each letter.
+        Names are expected to be already capitalized and deduplicated, so the
+        first characters are counted in a single pass.
 
         Returns:
-            pd.DataFrame: DataFrame with two columns:
+            List[Tuple[str, int]]: Rows sorted by letter, each containing:
                 - first_letter (str): Uppercase first letter of the animal name.
-                - count (int): Number of unique names that start with this letter.
+                - count (int): Number of names that start with this letter.
         """
         logger.info("Grouping animal names by initial letter...")
 
-        if not self.animal_names:
-            logger.warning("No animal names provided. Returning empty DataFrame.")
-            return pd.DataFrame(columns=["first_letter", "count"])
+        counts = Counter(name[0] for name in self.animal_names if name)
 
-        unique_names = pd.Series(self.animal_names).str.capitalize().drop_duplicates()
-        first_letters = unique_names.str[0]
+        if not counts:
+            logger.warning("No animal names provided. Returning empty result.")
+            return []
 
-        grouped_df = (
-            first_letters.value_counts()
-            .rename_axis("first_letter")
-            .reset_index(name="count")
-            .sort_values(by="first_letter")
-        )
+        grouped_rows = sorted(counts.items())
 
-        logger.info(f"Grouping finished. Found {len(grouped_df)} unique first letters.")
+        logger.info(
+            f"Grouping finished. Found {len(grouped_rows)} unique first letters."
+        )
 
-        return grouped_df
+        return grouped_rows
@@ -1,11 +1,21 @@
-from urllib.parse import urljoin, unquote
-from typing import List, Optional
+from urllib.parse import urljoin, unquote, urlsplit
+from typing import Iterator, List, Optional, Set
 
 import requests
-from bs4 import BeautifulSoup
-from bs4.element import ResultSet
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
 from loguru import logger
 
+# XPath expressions are compiled once at import time and reused for every page.
+_LI_XPATH = etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' mw-category ')"
+    " and contains(concat(' ', normalize-space(@class), ' '), ' mw-category-columns ')]//li"
+)
+_ANIMAL_TITLE_XPATH = etree.XPath("(.//a/@title)[1]")
+_NEXT_PAGE_HREF_XPATH = etree.XPath(
+    "//a[@href][normalize-space(text())='Следующая страница']/@href"
+)
+
 
 class WikiAnimalsParser:
     """
@@ -23,95 +33,206 @@ class WikiAnimalsParser:
             base_url (str): The root URL (e.g., "https://ru.wikipedia.org/").
         """
         self.base_url: str = base_url
-        self.animal_names: List[str] = []
+        self._base_origin: str = "{0.scheme}://{0.netloc}".format(urlsplit(base_url))
+        self.animal_names: Set[str] = set()
         self.parsed_pages_count: int = 0
 
+        self.session: requests.Session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=10))
+        self.session.headers.update(
+            {
+                "User-Agent": "wiki-animals-parser/1.0",
+                "Accept-Encoding": "gzip, deflate",
+            }
+        )
+
         logger.debug("WikiAnimalParser initialized.")
 
+    def __enter__(self) -> "WikiAnimalsParser":
+        """
+        Returns the parser itself for use in a `with` block.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Closes the HTTP session when the `with` block exits, even on errors.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the underlying HTTP session and releases pooled connections.
+        """
+        self.session.close()
+        logger.debug("HTTP session closed.")
+
     def parse(self, relative_url: Optional[str]) -> List[str]:
         """
-        Launches the recursive parsing process from the given relative URL.
+        Collects all animal names starting from the given relative URL.
 
-        Follows pagination, extracts animals, and adds them in self.animal_names list.
+        Thin wrapper around `iter_animals` kept for callers that need a list.
 
         Args:
-            relative_url (Optional[str]): A current relative URL to a category page.
+            relative_url (Optional[str]): A relative URL to the first category page.
 
         Returns:
             List[str]: A list of extracted animal names.
         """
-        if self.parsed_pages_count == 0:
-            logger.info("Starting parsing process...")
+        return list(self.iter_animals(relative_url=relative_url))
 
-        full_url = urljoin(base=self.base_url, url=unquote(relative_url))
-        soup = self._get_soup_object(url=full_url)
+    def iter_animals(self, relative_url: Optional[str]) -> Iterator[str]:
+        """
+        Lazily yields unique, capitalized animal names starting from the given relative URL.
+
+        Follows pagination page by page in a loop, yielding each new animal name
+        as soon as it is extracted. Names are deduplicated during scraping, so
+        consumers receive every capitalized name only once per iteration; the
+        collected names and page count are reset on each call.
+
+        Args:
+            relative_url (Optional[str]): A relative URL to the first category page.
+
+        Yields:
+            str: A unique capitalized animal name.
+        """
+        logger.info("Starting parsing process...")
+
+        self.animal_names = set()
+        self.parsed_pages_count = 0
+
+        while relative_url:
+            full_url = self._build_full_url(relative_url)
+            tree = self._get_html_tree(url=full_url)
+            if tree is None:
+                logger.warning(
+                    f"Empty page received: {full_url}. Finishing parsing process."
+                )
+                break
 
-        li_elements = self._get_li_elements(soup)
-        self._add_animals_to_data(li_elements)
+            li_elements = self._get_li_elements(tree)
+            relative_url = self._get_next_relative_url(tree)
 
-        next_relative_url = self._get_next_relative_url(soup)
-        if next_relative_url:
-            self.parse(relative_url=next_relative_url)
+            yield from self._extract_animal_names(li_elements)
         else:
             logger.warning(f"Next page not found. Finishing parsing process.")
-            logger.info("Parsing process completed.")
 
-        return self.animal_names
+        logger.info("Parsing process completed.")
 
-    @staticmethod
-    def _get_soup_object(url: str) -> BeautifulSoup:
+    def _build_full_url(self, relative_url: str) -> str:
+        """
+        Resolves a relative URL against the base URL.
+
+        Root-relative links (e.g. "/w/index.php?...") are joined to the
+        precomputed origin by plain concatenation; other links fall back to
+        `urljoin`. The URL is unquoted only when it contains escapes.
+
+        Args:
+            relative_url (str): A relative URL to a category page.
+
+        Returns:
+            str: The absolute URL.
+        """
+        if "%" in relative_url:
+            relative_url = unquote(relative_url)
+
+        if relative_url.startswith("/") and not relative_url.startswith("//"):
+            return self._base_origin + relative_url
+        return urljoin(base=self.base_url, url=relative_url)
+
+    def _get_html_tree(self, url: str) -> Optional[html.HtmlElement]:
         """
         Fetches and parses an HTML page from the given URL.
 
+        The request goes through the persistent session, so the keep-alive
+        connection to the host is reused across paginated pages. The response
+        is streamed: lxml reads the (decompressed) body straight from the socket,
+        so the whole page is never held in memory as a single bytes object.
+
         Args:
             url (str): Full URL to the target page.
 
         Returns:
-            BeautifulSoup: Parsed HTML content.
+            Optional[html.HtmlElement]: Root element of the parsed HTML document,
+                or None if the response body is empty.
         """
         logger.debug(f"Fetching URL: {url}")
-        response = requests.get(url=url)
-        response.raise_for_status()
-        return BeautifulSoup(response.text, "lxml")
+        with self.session.get(url=url, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            parser = self._get_html_parser(response)
+            return html.parse(response.raw, parser=parser).getroot()
+
+    @staticmethod
+    def _get_html_parser(response: requests.Response) -> Optional[html.HTMLParser]:
+        """
+        Builds an HTML parser for the charset declared in the Content-Type header.
+
+        lxml only sniffs `<meta charset>` when reading a stream and otherwise
+        falls back to Latin-1. requests also reports Latin-1 for `text/*` without
+        a charset, so the header is only trusted when it names one explicitly.
+
+        Args:
+            response (requests.Response): Response whose body is about to be parsed.
+
+        Returns:
+            Optional[html.HTMLParser]: Parser bound to the declared encoding,
+                or None to let lxml detect it from the document.
+        """
+        if "charset" not in response.headers.get("Content-Type", "").lower():
+            return None
+        return html.HTMLParser(encoding=response.encoding)
 
     @staticmethod
-    def _get_li_elements(soup: BeautifulSoup) -> ResultSet:
+    def _get_li_elements(tree: html.HtmlElement) -> List[html.HtmlElement]:
         """
         Extracts <li> elements into the <div> witch has the "mw-category.mw-category-columns" CSS class.
 
         Args:
-            soup (BeautifulSoup): Parsed HTML content.
+            tree (html.HtmlElement): Parsed HTML content.
 
         Returns:
-            ResultSet: Collection of <li> tags with animal links.
+            List[html.HtmlElement]: Collection of <li> tags with animal links.
         """
-        return soup.select(selector="div.mw-category.mw-category-columns li")
+        return _LI_XPATH(tree)
 
     @staticmethod
-    def _get_next_relative_url(soup: BeautifulSoup) -> Optional[str]:
+    def _get_next_relative_url(tree: html.HtmlElement) -> Optional[str]:
         """
         Finds the "Next page" link on the current page.
 
         Args:
-            soup (BeautifulSoup): Parsed HTML content.
+            tree (html.HtmlElement): Parsed HTML content.
         Returns:
             Optional[str]: The relative URL to the "Next page" or None if not found.
         """
-        next_relative_url = soup.find("a", string="Следующая страница", href=True)
-        return next_relative_url.get("href") if next_relative_url else None
+        next_relative_urls = _NEXT_PAGE_HREF_XPATH(tree)
+        return str(next_relative_urls[0]) if next_relative_urls else None
 
-    def _add_animals_to_data(self, li_elements: ResultSet) -> None:
+    def _extract_animal_names(
+        self, li_elements: List[html.HtmlElement]
+    ) -> Iterator[str]:
         """
-        Adds animal names from the <li> tags to a self.animal_names list.
+        Yields animal names from the <li> tags of a single category page.
+
+        Each name is capitalized and recorded in self.animal_names; names seen
+        before are skipped.
 
         Args:
-            li_elements (ResultSet): <li> tags from category page.
+            li_elements (List[html.HtmlElement]): <li> tags from category page.
+
+        Yields:
+            str: A new capitalized animal name taken from the link title.
         """
         for li in li_elements:
-            if li.find("a", title=True):
-                animal_name = li.a["title"]
-                logger.debug(f"Found animal name: {animal_name}")
-                self.animal_names.append(animal_name)
+            titles = _ANIMAL_TITLE_XPATH(li)
+            if titles:
+                animal_name = str(titles[0]).capitalize()
+                if animal_name in self.animal_names:
+                    continue
+                logger.debug("Found animal name: {}", animal_name)
+                self.animal_names.add(animal_name)
+                yield animal_name
 
         self.parsed_pages_count += 1
         logger.info(f"Animal names collected: {len(self.animal_names)}")
@@ -1,13 +1,16 @@
+import csv
+import re
 from pathlib import Path
-from typing import Union
+from typing import Iterable, Tuple, Union
 
-import pandas as pd
 from loguru import logger
 
+_WRITE_BUFFER_SIZE = 1 << 16
+
 
 class CSVReportWriter:
     """
-    Writes a pandas DataFrame to a CSV file in the specified directory.
+    Writes grouped rows to a CSV file in the specified directory.
     Automatically ensures uniqueness of the output filename to prevent overwriting.
     """
 
@@ -29,37 +32,53 @@ class CSVReportWriter:
         """
         Generates a unique file path to avoid overwriting existing CSV reports.
 
+        The base name is checked with a single `exists()` call, which follows the
+        filesystem's case sensitivity. If it is taken, the report directory is
+        listed once and the next suffix is taken after the highest existing one,
+        comparing names case-insensitively, instead of probing candidates one by one.
+
         Args:
             counter (int): Starting counter for uniqueness suffix. Defaults to 1.
         """
         self.report_dir.mkdir(parents=True, exist_ok=True)
 
-        while self.output_file_path.exists():
-            self.output_file_path = (
-                self.report_dir / f"{self.report_filename}({counter}).csv"
-            )
-            counter += 1
+        if not self.output_file_path.exists():
+            return
+
+        suffix_pattern = re.compile(
+            rf"{re.escape(self.report_filename.casefold())}\((\d+)\)\.csv"
+        )
+        suffixes = [
+            int(match.group(1))
+            for path in self.report_dir.iterdir()
+            if (match := suffix_pattern.fullmatch(path.name.casefold()))
+        ]
+        counter = max(counter, max(suffixes, default=0) + 1)
+
+        self.output_file_path = (
+            self.report_dir / f"{self.report_filename}({counter}).csv"
+        )
 
-    def write(self, df: pd.DataFrame, include_index: bool = False) -> None:
+    def write(self, rows: Iterable[Tuple[str, int]]) -> None:
         """
-        Writes the provided DataFrame to a uniquely named CSV file.
+        Writes the provided rows to a uniquely named CSV file.
 
         Args:
-            df (pd.DataFrame): The DataFrame to write to the CSV file.
-            include_index (bool): Whether to include the DataFrame index in the CSV output.
+            rows (Iterable[Tuple[str, int]]): The rows to write to the CSV file.
         """
-        if df.empty:
-            logger.warning(
-                "Provided DataFrame is empty. CSV report will not be written."
-            )
+        rows = list(rows)
+        if not rows:
+            logger.warning("Provided rows are empty. CSV report will not be written.")
             return
 
         self._generate_unique_file_path(counter=1)
         logger.info(f"Generating report...")
-        df.to_csv(
-            path_or_buf=self.output_file_path,
+        with open(
+            self.output_file_path,
+            "w",
+            buffering=_WRITE_BUFFER_SIZE,
             encoding="utf-8",
-            index=include_index,
-            header=False,
-        )
+            newline="",
+        ) as file:
+            csv.writer(file, lineterminator="\n").writerows(rows)
         logger.info(f"Report saved to: {self.output_file_path}")
@@ -26,25 +26,25 @@ def main() -> None:
           to avoid overwriting existing reports (e.g., `report.csv`, `report(1).csv`, ...).
     """
     # Load environment configuration
-    config = Config()
+    config = Config.load()
 
     # Setup logging
     LoggerConfigurator(log_file=config.LOG_FILE).setup_logger()
 
     # Scrape animal names from Wikipedia
-    parser = WikiAnimalsParser(base_url=config.BASE_URL)
-    animal_names = parser.parse(relative_url=config.RELATIVE_URL)
+    with WikiAnimalsParser(base_url=config.BASE_URL) as parser:
+        animal_names = parser.iter_animals(relative_url=config.RELATIVE_URL)
 
-    # Group animals by their first letter
-    structurer = DataStructurer(data=animal_names)
-    grouped_animals = structurer.group_animals_by_first_letter()
+        # Group animals by their first letter (consumes the names as they are scraped)
+        structurer = DataStructurer(data=animal_names)
+        grouped_animals = structurer.group_animals_by_first_letter()
 
     # Write a report to a CSV file
     report_writer = CSVReportWriter(
         report_dir=config.REPORT_DIR,
         report_filename=config.REPORT_FILENAME,
     )
-    report_writer.write(df=grouped_animals)
+    report_writer.write(rows=grouped_animals)
 
     logger.success(f"Wiki Animal Parser completed successfully!")
 
@@ -4,6 +4,9 @@ from typing import Union
 
 from loguru import logger
 
+# Level numbers shown in the console; compared as ints instead of level names.
+_CONSOLE_LEVEL_NOS = frozenset({logger.level("INFO").no, logger.level("SUCCESS").no})
+
 
 class LoggerConfigurator:
     """
@@ -55,7 +58,8 @@ class LoggerConfigurator:
         # Console output
         logger.add(
             sink=sys.stdout,
-            filter=lambda record: record["level"].name in ["INFO", "SUCCESS"],
+            level="INFO",
+            filter=lambda record: record["level"].no in _CONSOLE_LEVEL_NOS,
             format="<blue>{time:YYYY-MM-DD HH:mm:ss}</blue> | <green>{level}</green> | {message}",
         )
 